@@ -1,10 +1,24 @@
 from __future__ import annotations
 
 import json
+import mmap
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+try:  # orjson is optional; the stdlib parser is a drop-in fallback
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:  # pysimdjson is optional; used only for count/shape-only inspection
+    import simdjson
+except ImportError:  # pragma: no cover - depends on the environment
+    simdjson = None
+
+HAS_ORJSON = orjson is not None
+
 
 @dataclass(slots=True)
 class LoadError:
@@ -14,6 +28,136 @@ class LoadError:
 
 JsonData = Any  # We only lightly validate (list root for current datasets)
 
+# Types a JSON array root may come back as: plain lists from load_json, plus
+# simdjson's lazy Array proxy from load_json_lazy when pysimdjson is installed.
+JSON_ARRAY_TYPES: tuple[type, ...] = (list,) if simdjson is None else (list, simdjson.Array)
+
+# orjson parses straight from bytes; json.loads also accepts bytes (UTF-8
+# detection) so both paths skip a separate str decode step.
+_loads = orjson.loads if orjson is not None else json.loads
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError. UnicodeDecodeError
+# covers invalid UTF-8 on the stdlib path (orjson reports it as a decode error).
+_DECODE_ERRORS: tuple[type[ValueError], ...] = (json.JSONDecodeError, UnicodeDecodeError)
+
+# Files above this size are parsed straight from a read-only mmap (orjson
+# accepts buffer objects), avoiding a full copy into a bytes object. Below it
+# the mapping setup costs more than the copy it saves.
+_MMAP_MIN_SIZE = 256_000
+
+FileSignature = tuple[int, int]  # (st_mtime_ns, st_size)
+
+# Process-lifetime cache of parsed documents: path -> (mtime_ns, size, data).
+# Entries are reused while the file's stat signature is unchanged, so the
+# returned objects are shared and must be treated as read-only by callers.
+_CACHE: dict[Path, tuple[int, int, JsonData]] = {}
+
+# Sorted *.json listings per directory: dir -> (dir st_mtime_ns, paths). A
+# directory's mtime changes whenever an entry is added, removed or renamed.
+_DIR_CACHE: dict[Path, tuple[int, tuple[Path, ...]]] = {}
+
+
+def file_signature(path: Path) -> FileSignature | None:
+    """Return (st_mtime_ns, st_size) for ``path`` or None if it cannot be stat'ed."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def json_dir_signature(directory: Path) -> tuple[tuple[str, int, int], ...] | None:
+    """Cheap change detector for the ``*.json`` files in ``directory``.
+
+    Returns a sorted tuple of (name, st_mtime_ns, st_size) built from a single
+    ``os.scandir`` pass (no file contents are read), or None if the directory
+    cannot be listed. Entries are filtered like ``list_json_files``; callers
+    that need the paths should build them from these names rather than from
+    a second listing, so both describe the same scan.
+    """
+    entries: list[tuple[str, int, int]] = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue  # vanished between listing and stat
+                entries.append((entry.name, st.st_mtime_ns, st.st_size))
+    except OSError:
+        return None
+    entries.sort()
+    return tuple(entries)
+
+
+def list_json_files(directory: Path) -> tuple[Path, ...]:
+    """Sorted ``*.json`` paths in ``directory`` (empty if it cannot be read).
+
+    The listing is cached and reused while the directory's mtime is unchanged,
+    so repeated calls cost a single stat instead of a full glob + sort.
+    """
+    try:
+        mtime = directory.stat().st_mtime_ns
+    except OSError:
+        return ()
+    cached = _DIR_CACHE.get(directory)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    # os.scandir + a suffix check avoids glob's per-entry fnmatch and Path
+    # construction; Paths are only built for the matching names.
+    try:
+        with os.scandir(directory) as it:
+            names = sorted(e.name for e in it if e.name.endswith(".json") and e.is_file())
+    except OSError:
+        return ()
+    files = tuple(directory / name for name in names)
+    _DIR_CACHE[directory] = (mtime, files)
+    return files
+
+
+def dump_json(data: JsonData) -> bytes:
+    """Serialize ``data`` to compact UTF-8 JSON bytes (orjson when available).
+
+    The stdlib fallback mirrors the separators used by Starlette's JSONResponse
+    so both paths produce the same body shape.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+def _dedup_strings(data: JsonData) -> None:
+    """Make equal string values in ``data`` share one object, in place.
+
+    Datasets repeat many values (categories, language tags, empty strings),
+    so cached documents keep one copy of each. Containers are not rebuilt
+    and the walk uses an explicit stack, so nesting depth is not limited by
+    the recursion limit. Keys are already shared by the JSON parsers' key
+    caches.
+    """
+    pool: dict[str, str] = {}
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        slots = node.items() if isinstance(node, dict) else enumerate(node)
+        for k, v in slots:
+            if type(v) is str:
+                shared = pool.setdefault(v, v)
+                if shared is not v:
+                    node[k] = shared
+            elif isinstance(v, (dict, list)):
+                stack.append(v)
+
+
+def _loads_mmap(fd: int) -> JsonData:
+    # The memoryview must be released before the mapping can be closed.
+    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+        return orjson.loads(view)
+
 
 def load_json(path: Path) -> tuple[JsonData | None, LoadError | None]:
     """Pure JSON file loader.
@@ -21,14 +165,58 @@ def load_json(path: Path) -> tuple[JsonData | None, LoadError | None]:
     Returns a tuple of (data, error). Never raises. All filesystem and
     JSON parsing side-effects are contained here so that callers can
     translate domain/file errors into HTTP responses at the boundary.
+
+    Successfully parsed documents are cached per path and reused while the
+    file's (mtime_ns, size) signature is unchanged.
     """
-    if not path.exists():
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         return None, LoadError("not_found", f"{path.name} not found")
+    except OSError as e:  # IO error
+        return None, LoadError("io_error", f"Failed reading {path.name}: {e}")
+    cached = _CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2], None
+    try:
+        # fstat on the open descriptor so the cached signature describes the
+        # exact bytes read, even if the file is replaced after the stat above.
+        with path.open("rb") as f:
+            st = os.fstat(f.fileno())
+            if orjson is not None and st.st_size > _MMAP_MIN_SIZE:
+                data = _loads_mmap(f.fileno())
+            else:
+                data = _loads(f.read())
+    except FileNotFoundError:
+        return None, LoadError("not_found", f"{path.name} not found")
+    except _DECODE_ERRORS as e:
+        return None, LoadError("invalid_json", f"Invalid JSON in {path.name}: {e}")
+    except OSError as e:  # IO error
+        return None, LoadError("io_error", f"Failed reading {path.name}: {e}")
+    if isinstance(data, (dict, list)):
+        _dedup_strings(data)
+    _CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+    return data, None
+
+
+def load_json_lazy(path: Path) -> tuple[JsonData | None, LoadError | None]:
+    """Loader for callers that only need the root's type and length.
+
+    With pysimdjson installed the root is returned as a lazy proxy: elements
+    are only materialized into Python objects when indexed, so ``len()`` and
+    an ``isinstance(..., JSON_ARRAY_TYPES)`` check build no dicts at all.
+    Without it this is simply ``load_json``. Same (data, error) contract.
+    """
+    if simdjson is None:
+        return load_json(path)
     try:
-        text = path.read_text(encoding="utf-8")
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        return None, LoadError("not_found", f"{path.name} not found")
     except OSError as e:  # IO error
         return None, LoadError("io_error", f"Failed reading {path.name}: {e}")
     try:
-        return json.loads(text), None
-    except json.JSONDecodeError as e:
+        # A parser holds a single document at a time, so use a fresh one.
+        return simdjson.Parser().parse(raw), None
+    except ValueError as e:
         return None, LoadError("invalid_json", f"Invalid JSON in {path.name}: {e}")
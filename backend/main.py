@@ -1,29 +1,226 @@
+import asyncio
+import functools
+import gzip
+import hashlib
+import importlib.util
 import os
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Literal
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
 from pydantic import TypeAdapter, ValidationError
 
-from backend.loader import load_json
+try:  # Brotli is optional; gzip (stdlib) is always offered
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+from backend.loader import (
+    HAS_ORJSON,
+    JSON_ARRAY_TYPES,
+    FileSignature,
+    dump_json,
+    file_signature,
+    json_dir_signature,
+    list_json_files,
+    load_json,
+    load_json_lazy,
+)
 from backend.models import (
     ComplianceOut,
     RequirementOut,
     SolutionOut,
-    SolutionsIndexItem,
     SolutionsIndexOut,
     VulnerabilityOut,
 )
 
+# Bodies below this size are not worth compressing (same order as the
+# default minimum of Starlette's GZipMiddleware).
+_COMPRESS_MIN_SIZE = 500
+
+# Error message of the /api/solutions 404 detail (clients match on it).
+SOLUTIONS_NOT_FOUND = "solutions dataset not found"
+
+# Characters that cannot appear in a solutions dataset name. Rejecting them
+# keeps ``solutions_dir / name`` a single canonical path per file, so aliases
+# (``../solutions_json/x``) cannot each fill the per-path caches.
+_NAME_FORBIDDEN = frozenset("/\\\0")
+
+# Datasets only change on redeploy (or an admin reload), so let browsers and
+# proxies reuse cached responses for an hour and revalidate via ETag after.
+_CACHE_CONTROL = "public, max-age=3600"
+
+
+@dataclass(slots=True)
+class _CachedBody:
+    sig: FileSignature | None
+    body: bytes
+    etag: str
+    gzip: bytes | None = None
+    br: bytes | None = None
+
+    @classmethod
+    def build(cls, sig: FileSignature | None, body: bytes) -> "_CachedBody":
+        """Wrap ``body`` with a content-hash ETag."""
+        # Hashing the bytes (not the file signature) keeps the validator
+        # stable across workers, restarts and touch-only file changes.
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        return cls(sig, body, etag)
+
+    def compressed(self, coding: str) -> bytes:
+        """``body`` encoded with ``coding`` ("br" or "gzip").
+
+        Each variant is compressed on the first request that accepts it and
+        kept, so startup and encodings nobody asks for cost nothing.
+        """
+        if coding == "br":
+            if self.br is None:
+                self.br = brotli.compress(self.body, quality=5)
+            return self.br
+        if self.gzip is None:
+            # mtime=0 keeps the gzip bytes (and so their ETag) identical
+            # across workers and restarts.
+            self.gzip = gzip.compress(self.body, compresslevel=6, mtime=0)
+        return self.gzip
+
+
+def _accepted_values(header: str | None) -> set[str]:
+    """Values listed in an Accept or Accept-Encoding header, minus any with q=0.
+
+    Values are content codings or media ranges, lowercased and without
+    parameters.
+    """
+    accepted: set[str] = set()
+    for part in (header or "").split(","):
+        value, *params = part.split(";")
+        if any(p.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000") for p in params):
+            continue
+        if value := value.strip().lower():
+            accepted.add(value)
+    return accepted
+
+
+def _cached_response(request: Request, cached: _CachedBody) -> Response:
+    """Serve a cached body, picking a compressed variant when accepted."""
+    accepted = _accepted_values(request.headers.get("accept-encoding"))
+    headers = {"Vary": "Accept-Encoding", "Cache-Control": _CACHE_CONTROL}
+    coding = None
+    if len(cached.body) >= _COMPRESS_MIN_SIZE:
+        if brotli is not None and "br" in accepted:
+            coding = "br"
+        elif "gzip" in accepted:
+            coding = "gzip"
+    etag = cached.etag
+    if coding is not None:
+        # Each representation gets its own strong validator.
+        etag = f'{etag[:-1]}-{coding}"'
+    headers["ETag"] = etag
+    # Revalidation: a matching If-None-Match skips sending (or compressing)
+    # the body at all.
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    content = cached.body
+    if coding is not None:
+        content, headers["Content-Encoding"] = cached.compressed(coding), coding
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+@dataclass(slots=True)
+class _DatasetSchema:
+    """Dataset validator for a list of ``model`` rows."""
+
+    adapter: TypeAdapter
+
+    @classmethod
+    def for_model(cls, model: type) -> "_DatasetSchema":
+        return cls(TypeAdapter(list[model]))
+
+    def validate(self, data: list) -> list[dict[str, Any]]:
+        """Validate ``data`` and return it as plain dicts in the models' shape.
+
+        Defaults are filled in, unknown keys dropped and lax coercions applied,
+        so the result matches the declared response_model. Raises
+        pydantic.ValidationError if ``data`` does not match the schema.
+        """
+        return self.adapter.dump_python(self.adapter.validate_python(data))
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_projector(keys: tuple[str, ...], blank: str) -> Callable[[dict], dict]:
+    """Generate a straight-line row projector for rows with exactly ``keys``.
+
+    The generated function copies every key except ``blank``, which is set to
+    None, with no per-key branching. Keys are embedded via repr() so any key
+    string yields valid source.
+    """
+    fields = ", ".join(f"{k!r}: None" if k == blank else f"{k!r}: it[{k!r}]" for k in keys)
+    namespace: dict[str, Any] = {}
+    exec(f"def project(it):\n    return {{{fields}}}\n", namespace)
+    return namespace["project"]
+
 
 def _filter_lang(items: list[dict], lang: str) -> list[dict]:
-    if lang not in {"en", "es", "both"}:
-        return items
-    if lang == "both":
+    if lang not in ("en", "es") or not items:
         return items
     other = "es" if lang == "en" else "en"
-    return [{k: v for k, v in it.items() if k != other} for it in items]
+    # The other language block is blanked (not dropped) so the payload keeps
+    # the full response model shape when served as pre-serialized bytes.
+    # Validated rows all share the model's key set, so a projector specialized
+    # for the first row's keys applies to every row.
+    keys = items[0].keys()
+    if all(it.keys() == keys for it in items):
+        project = _compile_projector(tuple(keys), other)
+        return [project(it) for it in items]
+    # Heterogeneous rows: per-item C-level clone plus one assignment.
+    out: list[dict] = []
+    append = out.append
+    for it in items:
+        projected = it.copy()
+        if other in projected:
+            projected[other] = None
+        append(projected)
+    return out
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """True if an If-None-Match header value matches ``etag`` (weak compare)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+# Validation schemas are built once per process: TypeAdapter construction
+# (core-schema generation) is the expensive part, and the models are static.
+_CORE_SCHEMAS: dict[str, _DatasetSchema] = {
+    "requirements.json": _DatasetSchema.for_model(RequirementOut),
+    "compliance.json": _DatasetSchema.for_model(ComplianceOut),
+    "vulnerabilities.json": _DatasetSchema.for_model(VulnerabilityOut),
+}
+# Solutions datasets are validated lazily and cached per file.
+_SOLUTIONS_SCHEMA = _DatasetSchema.for_model(SolutionOut)
+
+
+# Rows per NDJSON chunk. Starlette iterates a sync generator in the
+# threadpool, one hop per chunk, so one chunk per row made streaming far
+# slower than serving the cached body.
+_NDJSON_BATCH = 64
+
+
+def _ndjson_rows(items: list[dict]) -> Iterator[bytes]:
+    for start in range(0, len(items), _NDJSON_BATCH):
+        batch = items[start : start + _NDJSON_BATCH]
+        yield b"".join([dump_json(it) + b"\n" for it in batch])
 
 
 def create_app(data_root: Path | None = None) -> FastAPI:
@@ -72,46 +269,70 @@ def create_app(data_root: Path | None = None) -> FastAPI:
         ]
         solutions_dir = next((c for c in sol_candidates if c.exists()), sol_candidates[-1])
 
-    app = FastAPI(title="PyYAML API")
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        # Heavy startup work runs here rather than in create_app, so importing
+        # backend.main (ASGI servers, test collection) stays cheap.
+        if not disable_eager:
+            validated_cache.update(await _eager_validate())
+        await _warm_caches()
+        yield
+
+    app = FastAPI(
+        title="PyYAML API",
+        default_response_class=ORJSONResponse if HAS_ORJSON else JSONResponse,
+        lifespan=lifespan,
+    )
 
     # ------------------------------------------------------------------
     # Eager validation setup
     # ------------------------------------------------------------------
-    # We validate core JSON datasets at startup so that structural issues
-    # fail fast instead of surfacing only on first request. Results are
-    # cached (as plain dicts) to avoid re-validating on every request.
-    # Can be disabled by setting APP_DISABLE_EAGER_VALIDATION=1.
+    # We validate core JSON datasets at startup (in the lifespan hook) so
+    # that structural issues fail fast instead of surfacing only on first
+    # request. Results are cached (as plain dicts) to avoid re-validating on
+    # every request. Can be disabled by setting APP_DISABLE_EAGER_VALIDATION=1.
     disable_eager = os.getenv("APP_DISABLE_EAGER_VALIDATION") == "1"
     validated_cache: dict[str, list[dict[str, Any]]] = {}
 
-    core_adapters: dict[str, TypeAdapter] = {
-        "requirements.json": TypeAdapter(list[RequirementOut]),
-        "compliance.json": TypeAdapter(list[ComplianceOut]),
-        "vulnerabilities.json": TypeAdapter(list[VulnerabilityOut]),
-    }
-
-    if not disable_eager:
-        for fname, adapter in core_adapters.items():
-            path = core_dir / fname
-            if not path.exists():
-                continue  # absence is not fatal; endpoint will 404 later
-            data, err = load_json(path)
-            if err:
-                # Treat invalid JSON or other IO issues as startup failure.
-                raise RuntimeError(f"Failed loading {fname}: {err.detail}")
-            if not isinstance(data, list):
-                raise RuntimeError(f"{fname} root must be a list")
-            try:
-                validated = adapter.validate_python(data)
-            except ValidationError as e:
-                raise RuntimeError(f"Validation error in {fname}: {len(e.errors())} issues") from e
-            # Store as list[dict] to keep response_model flow unchanged and
-            # allow subsequent filtering logic to operate on dicts.
-            validated_cache[fname] = [m.model_dump() for m in validated]
-
-    # Adapter for solutions datasets (validated lazily & cached per file)
-    solutions_adapter = TypeAdapter(list[SolutionOut])
-    solutions_validated_cache: dict[str, list[dict[str, Any]]] = {}
+    def _validate_one(fname: str, schema: _DatasetSchema) -> list[dict[str, Any]] | None:
+        data, err = load_json(core_dir / fname)
+        if err and err.kind == "not_found":
+            return None  # absence is not fatal; endpoint will 404 later
+        if err:
+            # Treat invalid JSON or other IO issues as startup failure.
+            raise RuntimeError(f"Failed loading {fname}: {err.detail}")
+        if not isinstance(data, list):
+            raise RuntimeError(f"{fname} root must be a list")
+        try:
+            return schema.validate(data)
+        except ValidationError as e:
+            raise RuntimeError(f"Validation error in {fname}: {e.error_count()} issues") from e
+
+    async def _eager_validate() -> dict[str, list[dict[str, Any]]]:
+        # The core files are independent: load and validate them in worker
+        # threads concurrently, so file reads overlap.
+        results = await asyncio.gather(
+            *(asyncio.to_thread(_validate_one, f, s) for f, s in _CORE_SCHEMAS.items())
+        )
+        return {f: data for f, data in zip(_CORE_SCHEMAS, results, strict=True) if data is not None}
+
+    # Lazily validated datasets: path -> (parsed object, validated rows).
+    # load_json hands back the same object until the file changes, so an
+    # identity check is enough to reuse the validation.
+    lazy_validated_cache: dict[Path, tuple[list, list[dict[str, Any]]]] = {}
+
+    # Pre-serialized response bodies (and their ETags) for the core list
+    # endpoints, keyed by (filename, lang) and invalidated when the source
+    # file's signature changes.
+    serialized_cache: dict[tuple[str, str], _CachedBody] = {}
+    # Same for /api/solutions datasets, keyed by path.
+    solutions_body_cache: dict[Path, _CachedBody] = {}
+
+    # Summary of every solutions dataset as (name, count, error), shared by
+    # /api/solutions/index and /api/hub. Rebuilt only when the directory
+    # signature (names, mtimes, sizes of *.json files) changes.
+    empty_index = _CachedBody.build(None, dump_json({"datasets": []}))
+    solutions_scan_cache: dict[str, Any] = {"sig": None, "entries": [], "index": empty_index}
     # -----------------------
     # CORS configuration
     # -----------------------
@@ -130,20 +351,60 @@ def create_app(data_root: Path | None = None) -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    # Compresses the responses not served from a cached body (NDJSON streams,
+    # /api/hub, error bodies). Cached bodies already carry Content-Encoding
+    # when compressed and are passed through untouched.
+    app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
+    # Development aid: report per-request handler time as a Server-Timing
+    # header (visible in browser devtools and asserted on by the tests).
+    if os.getenv("APP_DEBUG") == "1":
+
+        @app.middleware("http")
+        async def server_timing(request: Request, call_next):
+            start = time.perf_counter_ns()
+            response = await call_next(request)
+            dur_ms = (time.perf_counter_ns() - start) / 1e6
+            response.headers["Server-Timing"] = f"app;dur={dur_ms:.1f}"
+            return response
 
     @app.get("/health")
     def health():  # pragma: no cover - trivial
         return {"status": "ok"}
 
+    def _validate_rows(path: Path, data: list, schema: _DatasetSchema) -> list[dict]:
+        cached = lazy_validated_cache.get(path)
+        if cached is not None and cached[0] is data:
+            return cached[1]
+        try:
+            rows = schema.validate(data)
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=500,
+                detail={
+                    "file": path.name,
+                    # Location, type and message only: echoing the offending
+                    # input back can mean whole rows per error.
+                    "errors": e.errors(
+                        include_url=False, include_context=False, include_input=False
+                    ),
+                },
+            ) from e
+        lazy_validated_cache[path] = (data, rows)
+        return rows
+
     def _load_list(filename: str) -> list[dict]:
-        # If we have a validated cache entry, return a shallow copy to avoid accidental mutation
+        # Validated cache entries are returned as-is: the only consumer builds
+        # the per-(file, lang) serialized bodies, and projection copies rows.
         if filename in validated_cache:
-            return [dict(item) for item in validated_cache[filename]]
+            return validated_cache[filename]
 
-        # Fallback path-based loading (legacy or when eager validation disabled)
-        primary = core_dir / filename
-        path = primary if primary.exists() else repo_root / filename
+        # Fallback path-based loading (legacy or when not eagerly validated)
+        path = core_dir / filename
         data, err = load_json(path)
+        if err and err.kind == "not_found":
+            path = repo_root / filename
+            data, err = load_json(path)
         if err:
             if err.kind == "not_found":
                 raise HTTPException(status_code=404, detail=err.detail)
@@ -151,48 +412,71 @@ def create_app(data_root: Path | None = None) -> FastAPI:
         if not isinstance(data, list):
             raise HTTPException(status_code=500, detail=f"{filename} root must be a list")
 
-        # Validate on-demand if eager disabled
-        adapter = core_adapters.get(filename)
-        if adapter is not None and disable_eager:
-            try:
-                validated = adapter.validate_python(data)
-            except ValidationError as e:
-                raise HTTPException(
-                    status_code=500,
-                    detail={
-                        "file": filename,
-                        "errors": e.errors(),
-                    },
-                ) from e
-            data = [m.model_dump() for m in validated]
+        # Validate on demand: eager validation is disabled, or the lifespan
+        # hook did not run (e.g. lifespan off on the ASGI server).
+        schema = _CORE_SCHEMAS.get(filename)
+        if schema is not None:
+            data = _validate_rows(path, data, schema)
         return data
 
+    def _serialized(filename: str, lang: str) -> _CachedBody:
+        sig = file_signature(core_dir / filename) or file_signature(repo_root / filename)
+        key = (filename, lang)
+        cached = serialized_cache.get(key)
+        if cached is None or cached.sig != sig:
+            body = dump_json(_filter_lang(_load_list(filename), lang))
+            cached = serialized_cache[key] = _CachedBody.build(sig, body)
+        return cached
+
+    def _warm_serialized() -> None:
+        # Move serialization of the eagerly validated datasets to startup so
+        # the first request for each (file, lang) is already a cache hit.
+        for fname in validated_cache:
+            for lang in ("both", "en", "es"):
+                _serialized(fname, lang)
+
+    def _serve_list(request: Request, filename: str, lang: str) -> Response:
+        # Returning a Response directly bypasses response_model validation and
+        # re-serialization; the declared response_model still documents the shape.
+        return _cached_response(request, _serialized(filename, lang))
+
     @app.get("/api/requirements", response_model=list[RequirementOut])
     def api_requirements(
+        request: Request,
         lang: Literal["en", "es", "both"] = Query(
             "both", description="Return only one language block or both"
         ),
     ):
-        return _filter_lang(_load_list("requirements.json"), lang)
+        return _serve_list(request, "requirements.json", lang)
 
     @app.get("/api/compliance", response_model=list[ComplianceOut])
     def api_compliance(
+        request: Request,
         lang: Literal["en", "es", "both"] = Query(
             "both", description="Return only one language block or both"
         ),
     ):
-        return _filter_lang(_load_list("compliance.json"), lang)
+        return _serve_list(request, "compliance.json", lang)
 
     @app.get("/api/vulnerabilities", response_model=list[VulnerabilityOut])
     def api_vulnerabilities(
+        request: Request,
         lang: Literal["en", "es", "both"] = Query(
             "both", description="Return only one language block or both"
         ),
     ):
-        return _filter_lang(_load_list("vulnerabilities.json"), lang)
+        return _serve_list(request, "vulnerabilities.json", lang)
+
+    def _solutions_not_found(fname: str) -> HTTPException:
+        available = [p.name for p in list_json_files(solutions_dir)]
+        return HTTPException(
+            status_code=404,
+            detail={"error": SOLUTIONS_NOT_FOUND, "requested": fname, "available": available},
+        )
 
     @app.get("/api/solutions", response_model=list[SolutionOut])
     def api_solutions(
+        request: Request,
         name: str = Query(
             ...,  # required
             description=(
@@ -204,64 +488,103 @@ def create_app(data_root: Path | None = None) -> FastAPI:
         if not solutions_dir.exists():
             raise HTTPException(status_code=404, detail="solutions directory missing")
         fname = f"{name}.json" if not name.endswith(".json") else name
+        if not _NAME_FORBIDDEN.isdisjoint(fname):
+            raise _solutions_not_found(fname)
         path = solutions_dir / fname
+        wants_ndjson = "application/x-ndjson" in _accepted_values(request.headers.get("accept"))
+        # Hot path: an unchanged file is served from its cached body after a stat.
+        sig = file_signature(path)
+        cached = solutions_body_cache.get(path)
+        if not wants_ndjson and cached is not None and sig is not None and cached.sig == sig:
+            return _cached_response(request, cached)
+
         data, err = load_json(path)
         if err:
             if err.kind == "not_found":
-                available = sorted(p.name for p in solutions_dir.glob("*.json"))
-                raise HTTPException(
-                    status_code=404,
-                    detail={
-                        "error": "solutions dataset not found",
-                        "requested": fname,
-                        "available": available,
-                    },
-                )
+                raise _solutions_not_found(fname)
             raise HTTPException(status_code=500, detail=err.detail)
         if not isinstance(data, list):
             raise HTTPException(status_code=500, detail=f"{path.name} root must be a list")
 
-        # Lazy validation & caching for solutions datasets
-        cache_key = path.name
-        if cache_key in solutions_validated_cache:
-            return [dict(item) for item in solutions_validated_cache[cache_key]]
-        try:
-            validated = solutions_adapter.validate_python(data)
-        except ValidationError as e:
-            raise HTTPException(
-                status_code=500,
-                detail={
-                    "file": path.name,
-                    "errors": e.errors(),
-                },
-            ) from e
-        dumped = [m.model_dump() for m in validated]
-        solutions_validated_cache[cache_key] = dumped
-        return dumped
+        # Opt-in newline-delimited JSON: rows are encoded and sent one at a
+        # time, so the full serialized payload is never held in memory.
+        if wants_ndjson:
+            rows = _validate_rows(path, data, _SOLUTIONS_SCHEMA)
+            return StreamingResponse(_ndjson_rows(rows), media_type="application/x-ndjson")
+        return _cached_response(request, _solutions_body(path, sig, data))
 
-    @app.get("/api/solutions/index", response_model=SolutionsIndexOut)
-    def api_solutions_index():
-        if not solutions_dir.exists():
-            return {"datasets": []}
-        items: list[SolutionsIndexItem] = []
-        for p in sorted(solutions_dir.glob("*.json")):
-            data, err = load_json(p)
-            if err:
-                items.append(
-                    SolutionsIndexItem(
-                        name=p.stem,
-                        error="invalid_json" if err.kind == "invalid_json" else err.kind,
-                    )
-                )
+    def _solutions_body(path: Path, sig: FileSignature | None, data: list) -> _CachedBody:
+        # Lazy validation, cached until the file changes. Rows are validated
+        # once; serialize once and skip the per-request response_model pass.
+        rows = _validate_rows(path, data, _SOLUTIONS_SCHEMA)
+        cached = solutions_body_cache[path] = _CachedBody.build(sig, dump_json(rows))
+        return cached
+
+    def _warm_solutions() -> None:
+        # Build every valid solutions body up front so /api/solutions is a
+        # dict lookup after one stat from the first request. Broken files are
+        # skipped here and reported by the endpoint as before. Only the
+        # identity body is built; compressed variants stay lazy.
+        for path in list_json_files(solutions_dir):
+            sig = file_signature(path)
+            data, err = load_json(path)
+            if err or not isinstance(data, list):
                 continue
-            if isinstance(data, list):
-                items.append(SolutionsIndexItem(name=p.stem, count=len(data)))
+            try:
+                _solutions_body(path, sig, data)
+            except HTTPException:
+                continue
+
+    def _store_scan(sig: Any, paths: tuple[Path, ...], results: list) -> list:
+        entries: list[tuple[str, int | None, str | None]] = []
+        for p, (data, err) in zip(paths, results, strict=True):
+            if err:
+                entries.append((p.stem, None, err.kind))
+            elif isinstance(data, JSON_ARRAY_TYPES):
+                entries.append((p.stem, len(data), None))
             else:
-                items.append(SolutionsIndexItem(name=p.stem, error="root_not_list"))
-        return {"datasets": items}
+                entries.append((p.stem, None, "root_not_list"))
+        solutions_scan_cache["sig"] = sig
+        solutions_scan_cache["entries"] = entries
+        solutions_scan_cache["index"] = _CachedBody.build(
+            None,
+            dump_json({"datasets": [{"name": n, "count": c, "error": e} for n, c, e in entries]}),
+        )
+        return entries
+
+    async def _scan_solutions() -> list[tuple[str, int | None, str | None]]:
+        sig = json_dir_signature(solutions_dir)
+        if sig is None:
+            return []
+        if sig == solutions_scan_cache["sig"]:
+            return solutions_scan_cache["entries"]
+        # Changed since the last scan: read the files concurrently in worker
+        # threads so the event loop stays free. Only root type and length are
+        # needed. Paths come from the signature's own scan, so the stored
+        # signature always describes the entries built from it.
+        paths = tuple(solutions_dir / name for name, _, _ in sig)
+        results = await asyncio.gather(*(asyncio.to_thread(load_json_lazy, p) for p in paths))
+        return _store_scan(sig, paths, results)
+
+    async def _warm_caches() -> None:
+        # Serialize the eagerly validated datasets, the solutions datasets and
+        # the solutions index up front, so first requests are already served
+        # from memory.
+        _warm_serialized()
+        if not disable_eager:
+            _warm_solutions()
+        await _scan_solutions()
+
+    @app.get("/api/solutions/index", response_model=SolutionsIndexOut)
+    async def api_solutions_index(request: Request):
+        # Served from the body cached alongside the scan; an empty scan
+        # (missing/unreadable directory or no datasets) is the empty index.
+        if not solutions_dir.exists() or not await _scan_solutions():
+            return _cached_response(request, empty_index)
+        return _cached_response(request, solutions_scan_cache["index"])
 
     @app.get("/api/hub")
-    def api_hub():
+    async def api_hub():
         datasets = []
         for core in ["requirements", "compliance", "vulnerabilities"]:
             filename = f"{core}.json"
@@ -291,21 +614,53 @@ def create_app(data_root: Path | None = None) -> FastAPI:
             "sources": [],
         }
         if solutions_dir.exists():
-            for p in sorted(solutions_dir.glob("*.json")):
-                data, err = load_json(p)
-                if err or not isinstance(data, list):
-                    solutions_summary["sources"].append(
-                        {
-                            "name": p.stem,
-                            "error": err.kind if err else "root_not_list",
-                        }
-                    )
+            for name, _count, error in await _scan_solutions():
+                if error:
+                    solutions_summary["sources"].append({"name": name, "error": error})
                 else:
-                    solutions_summary["sources"].append({"name": p.stem})
+                    solutions_summary["sources"].append({"name": name})
         datasets.append(solutions_summary)
         return {"datasets": datasets}
 
+    if os.getenv("APP_ENABLE_ADMIN_RELOAD") == "1":
+
+        @app.post("/admin/reload", include_in_schema=False)
+        async def admin_reload():
+            # Development helper: re-read and re-validate the core datasets and
+            # drop every derived cache. On failure the previous state is kept.
+            fresh: dict[str, list[dict[str, Any]]] = {}
+            if not disable_eager:
+                try:
+                    fresh = await _eager_validate()
+                except RuntimeError as e:
+                    raise HTTPException(status_code=500, detail=str(e)) from e
+            validated_cache.clear()
+            validated_cache.update(fresh)
+            serialized_cache.clear()
+            lazy_validated_cache.clear()
+            solutions_body_cache.clear()
+            solutions_scan_cache.update({"sig": None, "entries": [], "index": empty_index})
+            await _warm_caches()
+            return {"reloaded": sorted(validated_cache)}
+
     return app
 
 
 app = create_app()
+
+
+if __name__ == "__main__":
+    # Production-style runner: `python -m backend.main`. Uses uvloop and
+    # httptools when installed (uvloop is not available on Windows) and one
+    # worker per CPU core; the read-only endpoints scale across processes.
+    import uvicorn
+
+    uvicorn.run(
+        "backend.main:app",
+        host=os.getenv("APP_HOST", "127.0.0.1"),
+        port=int(os.getenv("APP_PORT", "8000")),
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+        workers=int(os.getenv("APP_WORKERS", "0")) or os.cpu_count() or 1,
+        interface="asgi3",
+    )
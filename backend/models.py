@@ -1,6 +1,6 @@
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 # --------------------
@@ -131,9 +131,9 @@ class SolutionCodeExample(BaseModel):
 
 class SolutionDetails(BaseModel):
     language: str | None = None
-    insecure_code_example: SolutionCodeExample = SolutionCodeExample()
-    secure_code_example: SolutionCodeExample = SolutionCodeExample()
-    steps: list[str] = []
+    insecure_code_example: SolutionCodeExample = Field(default_factory=SolutionCodeExample)
+    secure_code_example: SolutionCodeExample = Field(default_factory=SolutionCodeExample)
+    steps: list[str] = Field(default_factory=list)
 
 
 class SolutionOut(BaseModel):
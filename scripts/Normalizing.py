@@ -1,12 +1,50 @@
+import functools
+import hashlib
+import json
+import os
+import pickle
+import warnings
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
-import yaml
+try:  # orjson is optional; the stdlib encoder produces the same output
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parsed YAML documents are pickled here, keyed by path + mtime + size, so
+# unchanged sources skip YAML parsing on the next run.
+YAML_CACHE_DIR = Path(os.getenv("FATEST_CACHE_DIR", Path.home() / ".cache" / "fatest"))
+
+
+@functools.cache
+def _yaml_loader() -> tuple[Any, type]:
+    """
+    Import PyYAML on first use and pick its safe loader: libyaml's
+    CSafeLoader when available (same output as the pure-Python SafeLoader).
+    Runs served entirely from the parse cache never pay for the import.
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", None)
+    if loader is None:
+        # Same results, but roughly an order of magnitude slower; make an
+        # accidental slow-path install visible (once per process).
+        warnings.warn(
+            "PyYAML was built without libyaml; falling back to the pure-Python "
+            "SafeLoader (much slower). Reinstall PyYAML with libyaml support.",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        loader = yaml.SafeLoader
+    return yaml, loader
 
 
 def yaml_safe_load(text: str) -> Any:
     """
-    We use safe_load to only produce basic, safe Python types.
+    We use the safe loader to only produce basic, safe Python types
+    (libyaml's CSafeLoader when PyYAML was built with it).
     General structure of the .yaml files ensures it will be
     converted into dictionaries due to the key:value structure.
 
@@ -17,7 +55,53 @@ def yaml_safe_load(text: str) -> Any:
         The parsed Python object, if parsing doesn't
         work then an empty dictionary is returned
     """
-    return yaml.safe_load(text) or {}
+    yaml, loader = _yaml_loader()
+    return yaml.load(text, Loader=loader) or {}
+
+
+def _load_yaml_file(path: str) -> Any:
+    """
+    Parse a YAML file straight from its bytes; the loader decodes UTF-8
+    itself, so the document is never materialized as one Python str.
+    """
+    yaml, loader = _yaml_loader()
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=loader) or {}
+
+
+def load_yaml_cached(path: str) -> Any:
+    """
+    Same as parsing the file with the safe loader, but memoized on disk.
+
+    The cache key covers the absolute path, st_mtime_ns and st_size, so any
+    edit to the source produces a fresh parse. A missing, unreadable or
+    corrupt cache entry simply falls back to parsing the YAML.
+
+    Args:
+        path: Path to the YAML file.
+
+    Returns:
+        The parsed Python object (empty dict for an empty document).
+    """
+    st = os.stat(path)
+    key = f"{os.path.abspath(path)}|{st.st_mtime_ns}|{st.st_size}"
+    entry = YAML_CACHE_DIR / f"{hashlib.blake2b(key.encode()).hexdigest()}.pkl"
+    try:
+        with open(entry, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    data = _load_yaml_file(path)
+    try:
+        YAML_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write then rename so a concurrent reader never sees a partial file.
+        tmp = entry.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(data, f, protocol=5)
+        os.replace(tmp, entry)
+    except OSError:
+        pass  # caching is best effort
+    return data
 
 
 def load_yaml_mapping(path: str) -> dict[str, Any]:
@@ -27,8 +111,7 @@ def load_yaml_mapping(path: str) -> dict[str, Any]:
     This preserves the original strict behaviour but exposes it via a
     clearly named function so callers can choose strict mapping-only loading.
     """
-    route = Path(path).read_text(encoding="utf-8")
-    data = yaml_safe_load(route)
+    data = load_yaml_cached(path)
     if not isinstance(data, dict):
         raise ValueError(f"YAML root must be a mapping (dict): {path}")
     return data
@@ -41,8 +124,7 @@ def load_yaml_sequence(path: str) -> list[Any]:
     Use this for files that are expected to be top-level YAML sequences,
     such as `solutions_android.yaml` in this workspace.
     """
-    route = Path(path).read_text(encoding="utf-8")
-    data = yaml_safe_load(route)
+    data = load_yaml_cached(path)
     if not isinstance(data, list):
         raise ValueError(f"YAML root must be a sequence (list): {path}")
     return data
@@ -61,12 +143,23 @@ def ensure_str(a: Any, default: str = "") -> str:
     Returns:
         A string representation of the given value or the default for None.
     """
+    # Most YAML scalars here are already str: return them without a call.
+    if type(a) is str:
+        return a
     if a is None:
         return default
     return str(a)
 
 
+def _opt_str(a: Any) -> str | None:
+    """Like ``ensure_str`` but keeps None as None, for optional fields."""
+    return None if a is None else ensure_str(a)
+
+
 def ensure_list_of_str(x: Any) -> list[str]:
+    # Lists are the common case (context, steps, references): test them first.
+    if type(x) is list:
+        return [el if type(el) is str else ensure_str(el) for el in x]
     if x is None:
         return []
     return [ensure_str(el) for el in x] if isinstance(x, list) else [ensure_str(x)]
@@ -128,9 +221,7 @@ def normalize_requirements(rid: str, raw: dict[str, Any]) -> dict[str, Any]:
         ),
         "references": [ensure_str(x) for x in refs],
         "metadata": raw.get("metadata", {}),
-        "last_update_time": ensure_str(raw.get("last_update_time"))
-        if raw.get("last_update_time") is not None
-        else None,
+        "last_update_time": _opt_str(raw.get("last_update_time")),
     }
     return build
 
@@ -179,9 +270,7 @@ def normalize_compliance(name: str, raw: dict[str, Any]) -> dict[str, Any]:
                 dlink = None
             definitions_list.append({"id": ensure_str(did), "title": dtitle, "link": dlink})
 
-    last = (
-        ensure_str(raw.get("last_update_time")) if raw.get("last_update_time") is not None else None
-    )
+    last = _opt_str(raw.get("last_update_time"))
 
     build = {
         "id": ensure_str(name),
@@ -195,6 +284,54 @@ def normalize_compliance(name: str, raw: dict[str, Any]) -> dict[str, Any]:
     return build
 
 
+# Score sub-block fields, in output order.
+_SCORE_BASE_KEYS = (
+    "attack_vector",
+    "attack_complexity",
+    "privileges_required",
+    "user_interaction",
+    "scope",
+    "confidentiality",
+    "integrity",
+    "availability",
+)
+_SCORE_TEMPORAL_KEYS = (
+    "exploit_code_maturity",
+    "remediation_level",
+    "report_confidence",
+)
+_SCORE_V4_BASE_KEYS = (
+    "attack_vector",
+    "attack_complexity",
+    "attack_requirements",
+    "privileges_required",
+    "user_interaction",
+    "confidentiality_vc",
+    "integrity_vi",
+    "availability_va",
+    "confidentiality_sc",
+    "integrity_si",
+    "availability_sa",
+)
+_SCORE_V4_THREAT_KEYS = ("exploit_maturity",)
+
+
+def _str_fields(keys: tuple[str, ...], src: dict[str, Any]) -> dict[str, str]:
+    """Map every key in ``keys`` to ``ensure_str(src.get(key))``, in order."""
+    return {k: ensure_str(src.get(k)) for k in keys}
+
+
+def _vulnerability_lang_block(block: dict[str, Any]) -> dict[str, Any]:
+    """Language block (en/es) of a vulnerability entry."""
+    return {
+        "title": ensure_str(block.get("title")),
+        "description": ensure_str(block.get("description")),
+        "impact": ensure_str(block.get("impact")),
+        "recommendation": ensure_str(block.get("recommendation")),
+        "threat": ensure_str(block.get("threat")),
+    }
+
+
 def normalize_vulnerability(rid: str, raw: dict[str, Any]) -> dict[str, Any]:
     """
     Normalize a single vulnerability entry.
@@ -218,16 +355,6 @@ def normalize_vulnerability(rid: str, raw: dict[str, Any]) -> dict[str, Any]:
     en = raw.get("en") or {}
     es = raw.get("es") or {}
 
-    # Define a language block to avoid repetitive code
-    def _lang_block(block: dict[str, Any]) -> dict[str, Any]:
-        return {
-            "title": ensure_str(block.get("title")),
-            "description": ensure_str(block.get("description")),
-            "impact": ensure_str(block.get("impact")),
-            "recommendation": ensure_str(block.get("recommendation")),
-            "threat": ensure_str(block.get("threat")),
-        }
-
     # Treating the example block structure
     ex = raw.get("examples") or {}
     examples = None
@@ -243,23 +370,10 @@ def normalize_vulnerability(rid: str, raw: dict[str, Any]) -> dict[str, Any]:
     score_temporal_raw = score_raw.get("temporal") or {}
     score_base = None
     if score_base_raw:
-        score_base = {
-            "attack_vector": ensure_str(score_base_raw.get("attack_vector")),
-            "attack_complexity": ensure_str(score_base_raw.get("attack_complexity")),
-            "privileges_required": ensure_str(score_base_raw.get("privileges_required")),
-            "user_interaction": ensure_str(score_base_raw.get("user_interaction")),
-            "scope": ensure_str(score_base_raw.get("scope")),
-            "confidentiality": ensure_str(score_base_raw.get("confidentiality")),
-            "integrity": ensure_str(score_base_raw.get("integrity")),
-            "availability": ensure_str(score_base_raw.get("availability")),
-        }
+        score_base = _str_fields(_SCORE_BASE_KEYS, score_base_raw)
     score_temporal = None
     if score_temporal_raw:
-        score_temporal = {
-            "exploit_code_maturity": ensure_str(score_temporal_raw.get("exploit_code_maturity")),
-            "remediation_level": ensure_str(score_temporal_raw.get("remediation_level")),
-            "report_confidence": ensure_str(score_temporal_raw.get("report_confidence")),
-        }
+        score_temporal = _str_fields(_SCORE_TEMPORAL_KEYS, score_temporal_raw)
     score: dict[str, Any] | None = None
     if score_base or score_temporal:
         score = {"base": score_base, "temporal": score_temporal}
@@ -270,24 +384,10 @@ def normalize_vulnerability(rid: str, raw: dict[str, Any]) -> dict[str, Any]:
     score4_threat_raw = score4_raw.get("threat") or {}
     score4_base = None
     if score4_base_raw:
-        score4_base = {
-            "attack_vector": ensure_str(score4_base_raw.get("attack_vector")),
-            "attack_complexity": ensure_str(score4_base_raw.get("attack_complexity")),
-            "attack_requirements": ensure_str(score4_base_raw.get("attack_requirements")),
-            "privileges_required": ensure_str(score4_base_raw.get("privileges_required")),
-            "user_interaction": ensure_str(score4_base_raw.get("user_interaction")),
-            "confidentiality_vc": ensure_str(score4_base_raw.get("confidentiality_vc")),
-            "integrity_vi": ensure_str(score4_base_raw.get("integrity_vi")),
-            "availability_va": ensure_str(score4_base_raw.get("availability_va")),
-            "confidentiality_sc": ensure_str(score4_base_raw.get("confidentiality_sc")),
-            "integrity_si": ensure_str(score4_base_raw.get("integrity_si")),
-            "availability_sa": ensure_str(score4_base_raw.get("availability_sa")),
-        }
+        score4_base = _str_fields(_SCORE_V4_BASE_KEYS, score4_base_raw)
     score4_threat = None
     if score4_threat_raw:
-        score4_threat = {
-            "exploit_maturity": ensure_str(score4_threat_raw.get("exploit_maturity")),
-        }
+        score4_threat = _str_fields(_SCORE_V4_THREAT_KEYS, score4_threat_raw)
     score_v4: dict[str, Any] | None = None
     if score4_base or score4_threat:
         score_v4 = {"base": score4_base, "threat": score4_threat}
@@ -306,24 +406,29 @@ def normalize_vulnerability(rid: str, raw: dict[str, Any]) -> dict[str, Any]:
     # building
     build = {
         "id": ensure_str(rid),
-        "en": _lang_block(en),
-        "es": _lang_block(es),
+        "en": _vulnerability_lang_block(en),
+        "es": _vulnerability_lang_block(es),
         "category": ensure_str(raw.get("category")),
         "examples": examples,
-        "remediation_time": ensure_str(raw.get("remediation_time"))
-        if raw.get("remediation_time") is not None
-        else None,
+        "remediation_time": _opt_str(raw.get("remediation_time")),
         "score": score,
         "score_v4": score_v4,
         "requirements": requirements,
         "metadata": {"en": {"details": en_metadata_details}},
-        "last_update_time": ensure_str(raw.get("last_update_time"))
-        if raw.get("last_update_time") is not None
-        else None,
+        "last_update_time": _opt_str(raw.get("last_update_time")),
     }
     return build
 
 
+def _code_example(name: str, sol: dict[str, Any]) -> dict[str, str]:
+    """Code example block ``name`` of a solution, with both fields as str."""
+    b = sol.get(name) or {}
+    return {
+        "description": ensure_str(b.get("description")),
+        "text": ensure_str(b.get("text")),
+    }
+
+
 def normalize_solutions(raw: dict[str, Any]) -> dict[str, Any]:
     """
     Normalize a single solutions entry.
@@ -351,18 +456,11 @@ def normalize_solutions(raw: dict[str, Any]) -> dict[str, Any]:
     # Now for the example structures
     solution = raw.get("solution") or {}
 
-    def code_example(name: str, sol: dict):
-        b = sol.get(name) or {}
-        return {
-            "description": ensure_str(b.get("description")),
-            "text": ensure_str(b.get("text")),
-        }
-
-    insecure = code_example("insecure_code_example", solution)
-    secure = code_example("secure_code_example", solution)
+    insecure = _code_example("insecure_code_example", solution)
+    secure = _code_example("secure_code_example", solution)
     language = ensure_str(solution.get("language") or "")
     steps = ensure_list_of_str(solution.get("steps"))
-    last = ensure_str(raw["last_update_time"]) if raw.get("last_update_time") is not None else None
+    last = _opt_str(raw.get("last_update_time"))
 
     build = {
         "vulnerability_id": vuln_id,
@@ -389,11 +487,9 @@ def parse_requirements(doc: dict[str, Any]) -> list[dict[str, Any]]:
     """
     Parse the full requirements mapping into a list of normalized entries.
     """
-    items: list[dict[str, Any]] = []
-    for rid, raw in doc.items():
-        if isinstance(raw, dict):
-            items.append(normalize_requirements(str(rid), raw))
-    return items
+    return [
+        normalize_requirements(str(rid), raw) for rid, raw in doc.items() if isinstance(raw, dict)
+    ]
 
 
 def parse_compliance(doc: dict[str, Any]) -> list[dict[str, Any]]:
@@ -402,20 +498,28 @@ def parse_compliance(doc: dict[str, Any]) -> list[dict[str, Any]]:
 
     This mirrors `parse_requirements` but for the compliance file's shape.
     """
-    items: list[dict[str, Any]] = []
-    for name, raw in doc.items():
-        if isinstance(raw, dict):
-            items.append(normalize_compliance(str(name), raw))
-    return items
+    return [
+        normalize_compliance(str(name), raw) for name, raw in doc.items() if isinstance(raw, dict)
+    ]
 
 
 def parse_vulnerabilities(doc: dict[str, Any]) -> list[dict[str, Any]]:
     """Parse full vulnerabilities mapping into a list of normalized entries."""
-    items: list[dict[str, Any]] = []
-    for vid, raw in doc.items():
-        if isinstance(raw, dict):
-            items.append(normalize_vulnerability(str(vid), raw))
-    return items
+    return [
+        normalize_vulnerability(str(vid), raw) for vid, raw in doc.items() if isinstance(raw, dict)
+    ]
+
+
+def iter_solutions(doc: Any) -> Iterator[dict[str, Any]]:
+    """Lazily yield normalized solution entries (see `parse_solutions`)."""
+    # if isinstance(doc, dict):
+    #    for _, raw in doc.items():
+    #       if isinstance(raw, dict):
+    #            yield normalize_solutions(raw)
+    if isinstance(doc, list):
+        for raw in doc:
+            if isinstance(raw, dict):
+                yield normalize_solutions(raw)
 
 
 def parse_solutions(doc: Any) -> list[dict[str, Any]]:
@@ -426,16 +530,7 @@ def parse_solutions(doc: Any) -> list[dict[str, Any]]:
     own `vulnerability_id` field. For list inputs entries are processed in
     order.
     """
-    items: list[dict[str, Any]] = []
-    # if isinstance(doc, dict):
-    #    for _, raw in doc.items():
-    #       if isinstance(raw, dict):
-    #            items.append(normalize_solutions(raw))
-    if isinstance(doc, list):
-        for raw in doc:
-            if isinstance(raw, dict):
-                items.append(normalize_solutions(raw))
-    return items
+    return list(iter_solutions(doc))
 
 
 ##################################################################
@@ -460,3 +555,42 @@ def count_ids_in_yaml(path: str) -> int:
     data = load_yaml_mapping(path)
     # load_yaml_file guarantees `data` is a dict (or raises), so simply return len
     return len(data)
+
+
+def dump_json_indented(data: Any) -> bytes:
+    """Serialize ``data`` as UTF-8 JSON with a 2-space indent.
+
+    Uses orjson when installed; the stdlib fallback
+    (``ensure_ascii=False, indent=2``) produces the same bytes.
+
+    Args:
+        data: JSON-compatible Python object.
+
+    Returns:
+        The encoded document.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def write_json_array(path: Path, items: Iterable[Any]) -> None:
+    """Stream ``items`` to ``path`` as an indented JSON array.
+
+    Each element is encoded on its own and written through a 1 MiB buffer,
+    so only one element is held in serialized form at a time and ``items``
+    may be a generator. The bytes match ``dump_json_indented(list(items))``:
+    encoded elements are re-indented one level (JSON strings escape their
+    newlines, so every raw newline is structural).
+
+    Args:
+        path: Output file.
+        items: JSON-compatible elements, in order.
+    """
+    with open(path, "wb", buffering=1 << 20) as f:
+        first = True
+        for item in items:
+            f.write(b"[\n  " if first else b",\n  ")
+            f.write(dump_json_indented(item).replace(b"\n", b"\n  "))
+            first = False
+        f.write(b"[]" if first else b"\n]")
@@ -1,8 +1,8 @@
-import json
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-from Normalizing import load_yaml_sequence, parse_solutions
+from Normalizing import iter_solutions, load_yaml_sequence, write_json_array
 
 SCRIPT_ROOT = Path(__file__).resolve().parent
 REPO_ROOT = SCRIPT_ROOT.parents[1]
@@ -18,22 +18,35 @@ OUT_DIR = Path(
 OUT_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _one(yaml_path: Path) -> tuple[str | None, str]:
+    """Convert a single YAML file; returns (output name or None, message).
+
+    Runs in a worker process, so it only returns results; printing happens
+    in the parent to keep the log lines whole and in order.
+    """
+    try:
+        data = load_yaml_sequence(str(yaml_path))
+    except Exception as e:
+        return None, f"[SKIP] {yaml_path.name}: {e}"
+    out_path = OUT_DIR / (yaml_path.stem + ".json")
+    # Normalize and encode entry by entry straight into the output file.
+    write_json_array(out_path, iter_solutions(data))
+    return out_path.name, f"[OK] {yaml_path.name} -> {out_path.relative_to(Path.cwd())}"
+
+
 def build_all() -> list[str]:
     written = []
     if not RAW_SOLUTIONS_DIR.exists():
         print(f"[WARN] Source solutions YAML directory missing: {RAW_SOLUTIONS_DIR}")
         return written
-    for yaml_path in RAW_SOLUTIONS_DIR.glob("*.yaml"):
-        try:
-            data = load_yaml_sequence(str(yaml_path))
-        except Exception as e:
-            print(f"[SKIP] {yaml_path.name}: {e}")
-            continue
-        solutions = parse_solutions(data)
-        out_path = OUT_DIR / (yaml_path.stem + ".json")
-        out_path.write_text(json.dumps(solutions, ensure_ascii=False, indent=2), encoding="utf-8")
-        written.append(out_path.name)
-        print(f"[OK] {yaml_path.name} -> {out_path.relative_to(Path.cwd())}")
+    yaml_paths = sorted(RAW_SOLUTIONS_DIR.glob("*.yaml"))
+    # Each file is parsed, normalized and encoded independently, so spread
+    # the CPU-bound work across cores.
+    with ProcessPoolExecutor() as ex:
+        for name, message in ex.map(_one, yaml_paths):
+            print(message)
+            if name is not None:
+                written.append(name)
     return written
 
 
@@ -1,4 +1,3 @@
-import json
 import sys
 from pathlib import Path
 
@@ -9,6 +8,7 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from backend.loader import dump_json  # noqa: E402
 from backend.main import create_app
 
 
@@ -99,16 +99,25 @@ def build_solution_dataset() -> list[dict]:
 # ---------------------------------------------------------------------------
 # Core data_root fixture writing JSON files for the app factory
 # ---------------------------------------------------------------------------
-@pytest.fixture()
-def data_root(tmp_path: Path) -> Path:
-    (tmp_path / "requirements.json").write_text(json.dumps([build_requirement()]))
-    (tmp_path / "compliance.json").write_text(json.dumps([build_compliance()]))
-    (tmp_path / "vulnerabilities.json").write_text(json.dumps([build_vulnerability()]))
+def write_datasets(root: Path) -> Path:
+    # dump_json encodes with orjson when installed (stdlib json otherwise).
+    (root / "requirements.json").write_bytes(dump_json([build_requirement()]))
+    (root / "compliance.json").write_bytes(dump_json([build_compliance()]))
+    (root / "vulnerabilities.json").write_bytes(dump_json([build_vulnerability()]))
 
-    solutions_dir = tmp_path / "solutions_json"
+    solutions_dir = root / "solutions_json"
     solutions_dir.mkdir()
-    (solutions_dir / "python.json").write_text(json.dumps(build_solution_dataset()))
-    return tmp_path
+    (solutions_dir / "python.json").write_bytes(dump_json(build_solution_dataset()))
+    return root
+
+
+@pytest.fixture()
+def data_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    # Fresh copy per test: use this for tests that modify the dataset files.
+    # Apps built from it serve the fixture solutions, not the repository's.
+    root = write_datasets(tmp_path)
+    monkeypatch.setenv("APP_SOLUTIONS_DIR", str(root / "solutions_json"))
+    return root
 
 
 # ---------------------------------------------------------------------------
@@ -132,8 +141,14 @@ def compliance_sample() -> dict:
 # ---------------------------------------------------------------------------
 # FastAPI TestClient fixture
 # ---------------------------------------------------------------------------
-@pytest.fixture()
-def app_client(data_root: Path):
-    app = create_app(data_root=data_root)
+@pytest.fixture(scope="session")
+def app_client(tmp_path_factory: pytest.TempPathFactory):
+    # One app for the whole session: tests using it must only read. Tests
+    # that modify files build their own app from the data_root fixture.
+    root = write_datasets(tmp_path_factory.mktemp("data"))
+    with pytest.MonkeyPatch.context() as mp:
+        # Serve the fixture solutions rather than the repository's datasets.
+        mp.setenv("APP_SOLUTIONS_DIR", str(root / "solutions_json"))
+        app = create_app(data_root=root)
     with TestClient(app) as client:
         yield client
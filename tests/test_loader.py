@@ -1,4 +1,5 @@
-from backend.loader import load_json
+from backend import loader
+from backend.loader import JSON_ARRAY_TYPES, list_json_files, load_json, load_json_lazy
 
 
 def test_load_json_not_found(tmp_path):
@@ -21,3 +22,79 @@ def test_load_json_valid(tmp_path):
     data, err = load_json(f)
     assert err is None
     assert isinstance(data, list)
+
+
+def test_load_json_invalid_utf8(tmp_path):
+    f = tmp_path / "latin1.json"
+    f.write_bytes(b'["caf\xe9"]')
+    data, err = load_json(f)
+    assert data is None
+    assert err and err.kind == "invalid_json"
+
+
+def test_load_json_cached_until_file_changes(tmp_path):
+    f = tmp_path / "ok.json"
+    f.write_text('[{"a": 1}]')
+    first, _ = load_json(f)
+    second, _ = load_json(f)
+    assert first is second
+
+    f.write_text('[{"a": 1}, {"a": 2}]')
+    third, err = load_json(f)
+    assert err is None
+    assert len(third) == 2
+
+
+def test_load_json_large_file_via_mmap(tmp_path, monkeypatch):
+    monkeypatch.setattr(loader, "_MMAP_MIN_SIZE", 0)
+    ok = tmp_path / "ok.json"
+    ok.write_text('[{"a": 1}]')
+    data, err = load_json(ok)
+    assert err is None
+    assert data == [{"a": 1}]
+
+    bad = tmp_path / "bad.json"
+    bad.write_text("[{")
+    data, err = load_json(bad)
+    assert data is None
+    assert err and err.kind == "invalid_json"
+
+
+def test_load_json_lazy_exposes_root_length(tmp_path):
+    f = tmp_path / "ok.json"
+    f.write_text('[{"a": 1}, {"a": 2}]')
+    data, err = load_json_lazy(f)
+    assert err is None
+    assert isinstance(data, JSON_ARRAY_TYPES)
+    assert len(data) == 2
+
+    data, err = load_json_lazy(tmp_path / "missing.json")
+    assert data is None
+    assert err and err.kind == "not_found"
+
+
+def test_list_json_files_refreshes_on_new_entry(tmp_path):
+    (tmp_path / "b.json").write_text("[]")
+    (tmp_path / "notes.txt").write_text("")
+    assert [p.name for p in list_json_files(tmp_path)] == ["b.json"]
+    (tmp_path / "a.json").write_text("[]")
+    assert [p.name for p in list_json_files(tmp_path)] == ["a.json", "b.json"]
+    assert list_json_files(tmp_path / "missing") == ()
+
+
+def test_load_json_shares_repeated_strings(tmp_path):
+    f = tmp_path / "rows.json"
+    f.write_text('[{"category": "web"}, {"category": "web"}]')
+    data, err = load_json(f)
+    assert err is None
+    assert data[0]["category"] is data[1]["category"]
+
+
+def test_load_json_deeply_nested(tmp_path):
+    p = tmp_path / "deep.json"
+    p.write_text("[" * 600 + '"deep value", "deep value"' + "]" * 600)
+    data, err = load_json(p)
+    assert err is None
+    for _ in range(599):
+        data = data[0]
+    assert data[0] is data[1]  # dedup reaches the innermost level
@@ -1,3 +1,12 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import main
+from backend.main import create_app
+
+
 def test_requirements_both(app_client):
     resp = app_client.get("/api/requirements?lang=both")
     assert resp.status_code == 200
@@ -21,3 +30,142 @@ def test_requirements_single_lang_es(app_client):
     item = resp.json()[0]
     assert "es" in item
     assert item["en"] is None
+
+
+def test_requirements_body_refreshed_after_file_change(data_root, monkeypatch):
+    monkeypatch.setenv("APP_DISABLE_EAGER_VALIDATION", "1")
+    with TestClient(create_app(data_root=data_root)) as client:
+        assert len(client.get("/api/requirements?lang=en").json()) == 1
+        path = data_root / "requirements.json"
+        reqs = json.loads(path.read_text())
+        reqs.append({**reqs[0], "id": "REQ-2"})
+        path.write_text(json.dumps(reqs))
+        body = client.get("/api/requirements?lang=en").json()
+        assert [item["id"] for item in body] == ["REQ-1", "REQ-2"]
+        assert body[1]["es"] is None
+
+
+@pytest.mark.parametrize("disable_eager", ["0", "1"], ids=["eager", "lazy"])
+def test_requirements_served_in_response_model_shape(data_root, monkeypatch, disable_eager):
+    monkeypatch.setenv("APP_DISABLE_EAGER_VALIDATION", disable_eager)
+    path = data_root / "requirements.json"
+    reqs = json.loads(path.read_text())
+    reqs[0]["supported_in"] = {"python": "yes"}
+    reqs[0]["en"]["x"] = "unknown"
+    path.write_text(json.dumps(reqs))
+    with TestClient(create_app(data_root=data_root)) as client:
+        item = client.get("/api/requirements").json()[0]
+        assert item["supported_in"] == {"python": True}
+        assert "x" not in item["en"]
+
+
+def test_requirements_etag_revalidation(app_client):
+    first = app_client.get("/api/requirements?lang=en")
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "public, max-age=3600"
+    assert etag != app_client.get("/api/requirements?lang=es").headers["etag"]
+
+    resp = app_client.get("/api/requirements?lang=en", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+
+    resp = app_client.get("/api/requirements?lang=en", headers={"If-None-Match": '"stale"'})
+    assert resp.status_code == 200
+    assert resp.json() == first.json()
+
+
+def test_requirements_etag_stable_across_apps(data_root):
+    # Content-hash validators match between workers/restarts serving the same data.
+    with (
+        TestClient(create_app(data_root=data_root)) as a,
+        TestClient(create_app(data_root=data_root)) as b,
+    ):
+        assert (
+            a.get("/api/requirements").headers["etag"] == b.get("/api/requirements").headers["etag"]
+        )
+
+
+def test_admin_reload_refreshes_eager_cache(data_root, monkeypatch):
+    monkeypatch.setenv("APP_ENABLE_ADMIN_RELOAD", "1")
+    with TestClient(create_app(data_root=data_root)) as client:
+        path = data_root / "requirements.json"
+        reqs = json.loads(path.read_text())
+        reqs.append({**reqs[0], "id": "REQ-2"})
+        path.write_text(json.dumps(reqs))
+        # Eagerly validated data is served until an explicit reload.
+        assert len(client.get("/api/requirements").json()) == 1
+        resp = client.post("/admin/reload")
+        assert resp.status_code == 200
+        assert "requirements.json" in resp.json()["reloaded"]
+        assert len(client.get("/api/requirements").json()) == 2
+
+
+def test_admin_reload_disabled_by_default(app_client):
+    assert app_client.post("/admin/reload").status_code == 404
+
+
+def test_requirements_precompressed_variants(data_root, monkeypatch):
+    monkeypatch.setattr(main, "_COMPRESS_MIN_SIZE", 0)
+    with TestClient(create_app(data_root=data_root)) as client:
+        plain = client.get("/api/requirements", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in plain.headers
+        assert plain.headers["vary"] == "Accept-Encoding"
+
+        gz = client.get("/api/requirements", headers={"Accept-Encoding": "gzip"})
+        assert gz.headers["content-encoding"] == "gzip"
+        assert gz.json() == plain.json()
+        assert gz.headers["etag"] != plain.headers["etag"]
+        with client.stream("GET", "/api/requirements", headers={"Accept-Encoding": "gzip"}) as r:
+            raw = b"".join(r.iter_raw())
+        assert raw[4:8] == b"\0\0\0\0"  # no timestamp in the gzip header
+
+        refused = client.get("/api/requirements", headers={"Accept-Encoding": "gzip;q=0"})
+        assert "content-encoding" not in refused.headers
+
+        revalidated = client.get(
+            "/api/requirements",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": gz.headers["etag"]},
+        )
+        assert revalidated.status_code == 304
+
+
+def test_requirements_invalid_row_reports_pydantic_errors(data_root, monkeypatch):
+    monkeypatch.setenv("APP_DISABLE_EAGER_VALIDATION", "1")
+    path = data_root / "requirements.json"
+    reqs = json.loads(path.read_text())
+    del reqs[0]["references"]
+    path.write_text(json.dumps(reqs))
+    with TestClient(create_app(data_root=data_root)) as client:
+        resp = client.get("/api/requirements")
+        assert resp.status_code == 500
+        detail = resp.json()["detail"]
+        assert detail["file"] == "requirements.json"
+        assert detail["errors"] == [
+            {"type": "missing", "loc": [0, "references"], "msg": "Field required"}
+        ]
+
+
+def test_eager_validation_serves_startup_snapshot(data_root):
+    with TestClient(create_app(data_root=data_root)) as client:
+        path = data_root / "requirements.json"
+        reqs = json.loads(path.read_text())
+        path.write_text(json.dumps(reqs + [{**reqs[0], "id": "REQ-2"}]))
+        body = client.get("/api/requirements").json()
+        assert [item["id"] for item in body] == ["REQ-1"]
+
+
+def test_eager_validation_rejects_invalid_core_data(data_root):
+    (data_root / "compliance.json").write_text(json.dumps([{"id": "C-1"}]))
+    app = create_app(data_root=data_root)  # validation runs at startup, not here
+    with pytest.raises(RuntimeError, match="compliance.json"), TestClient(app):
+        pass
+
+
+def test_core_data_validated_without_lifespan(data_root):
+    (data_root / "requirements.json").write_text(json.dumps([{"id": 1, "category": None}]))
+    # No context manager: the lifespan hook (and eager validation) never runs.
+    client = TestClient(create_app(data_root=data_root))
+    resp = client.get("/api/requirements")
+    assert resp.status_code == 500
+    assert resp.json()["detail"]["file"] == "requirements.json"
+    assert client.get("/api/compliance").status_code == 200
@@ -1,26 +1,161 @@
-def test_solutions_index(app_client):
-    resp = app_client.get("/api/solutions/index")
-    assert resp.status_code == 200
-    body = resp.json()
+import json
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.main import create_app
+
+
+def _check_index(body):
     assert "datasets" in body
     names = [d["name"] for d in body["datasets"]]
     assert "python" in names
 
 
-def test_solution_dataset_success(app_client):
-    resp = app_client.get("/api/solutions?name=python")
-    assert resp.status_code == 200
-    data = resp.json()
-    # In isolated fixture mode we expect 1; with real dataset present we just assert non-empty.
-    assert len(data) >= 1
+def _check_dataset(data):
+    assert len(data) == 1
     # Basic shape expectations
     first = data[0]
-    assert "vulnerability_id" in first
+    assert first["vulnerability_id"] == "VULN-1"
     assert "title" in first
 
 
-def test_solution_dataset_missing(app_client):
-    resp = app_client.get("/api/solutions?name=not-there")
-    assert resp.status_code == 404
-    detail = resp.json()["detail"]
-    assert detail["error"] == "solutions dataset not found"
+def _check_missing(body):
+    assert body["detail"]["error"] == "solutions dataset not found"
+
+
+@pytest.mark.parametrize(
+    ("path", "status", "check"),
+    [
+        ("/api/solutions/index", 200, _check_index),
+        ("/api/solutions?name=python", 200, _check_dataset),
+        ("/api/solutions?name=not-there", 404, _check_missing),
+        ("/api/solutions?name=../solutions_json/python", 404, _check_missing),
+        ("/api/solutions?name=..%5Csolutions_json%5Cpython", 404, _check_missing),
+    ],
+    ids=["index", "dataset", "missing", "path-alias", "backslash-alias"],
+)
+def test_solutions_endpoints(app_client, path, status, check):
+    resp = app_client.get(path)
+    assert resp.status_code == status
+    check(resp.json())
+
+
+def test_solutions_index_picks_up_new_dataset(data_root):
+    solutions_dir = data_root / "solutions_json"
+    with TestClient(create_app(data_root=data_root)) as client:
+        names = [d["name"] for d in client.get("/api/solutions/index").json()["datasets"]]
+        assert names == ["python"]
+        (solutions_dir / "broken.json").write_text("{")
+        datasets = client.get("/api/solutions/index").json()["datasets"]
+        assert [d["name"] for d in datasets] == ["broken", "python"]
+        assert datasets[0]["error"] == "invalid_json"
+        hub = client.get("/api/hub").json()["datasets"][-1]
+        assert hub["sources"] == [{"name": "broken", "error": "invalid_json"}, {"name": "python"}]
+
+
+def test_solutions_index_sees_files_added_within_one_mtime_tick(data_root):
+    solutions_dir = data_root / "solutions_json"
+    with TestClient(create_app(data_root=data_root)) as client:
+        st = solutions_dir.stat()
+        (solutions_dir / "extra.json").write_text("[]")
+        (solutions_dir / "nested.json").mkdir()  # not a dataset
+        # Restore the directory mtime, as if both changes landed in one tick.
+        os.utime(solutions_dir, ns=(st.st_atime_ns, st.st_mtime_ns))
+        datasets = client.get("/api/solutions/index").json()["datasets"]
+        assert [d["name"] for d in datasets] == ["extra", "python"]
+
+
+def test_solutions_index_cached_body(data_root):
+    with TestClient(create_app(data_root=data_root)) as client:
+        resp = client.get("/api/solutions/index")
+        assert resp.json() == {"datasets": [{"name": "python", "count": 1, "error": None}]}
+        assert resp.headers["cache-control"] == "public, max-age=3600"
+        again = client.get("/api/solutions/index", headers={"If-None-Match": resp.headers["etag"]})
+        assert again.status_code == 304
+
+
+def test_solutions_server_timing_budget(data_root, monkeypatch, app_client):
+    assert "server-timing" not in app_client.get("/api/solutions/index").headers
+    monkeypatch.setenv("APP_DEBUG", "1")
+    with TestClient(create_app(data_root=data_root)) as client:
+        for path in ("/api/solutions/index", "/api/solutions?name=python"):
+            client.get(path)  # first hit may build the cached body
+            timing = client.get(path).headers["server-timing"]
+            assert timing.startswith("app;dur=")
+            assert float(timing.removeprefix("app;dur=")) < 50
+
+
+def test_solution_dataset_warmed_at_startup(data_root, monkeypatch):
+    with TestClient(create_app(data_root=data_root)) as client:
+        # The body was built in the lifespan hook, so the file is not re-read.
+        monkeypatch.setattr("backend.main.load_json", lambda path: pytest.fail(str(path)))
+        resp = client.get("/api/solutions?name=python")
+        assert resp.status_code == 200
+        assert resp.json()[0]["vulnerability_id"] == "VULN-1"
+
+
+def test_solution_dataset_ndjson(app_client):
+    resp = app_client.get("/api/solutions?name=python", headers={"Accept": "application/x-ndjson"})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert rows == app_client.get("/api/solutions?name=python").json()
+
+
+def test_solution_dataset_ndjson_negotiation(data_root):
+    path = data_root / "solutions_json" / "python.json"
+    path.write_text(json.dumps(json.loads(path.read_text()) * 130))  # spans several chunks
+    with TestClient(create_app(data_root=data_root)) as client:
+        rows = client.get("/api/solutions?name=python").json()
+        resp = client.get("/api/solutions?name=python", headers={"Accept": "application/x-ndjson"})
+        assert [json.loads(line) for line in resp.text.splitlines()] == rows
+        refused = {"Accept": "application/x-ndjson;q=0, application/json"}
+        resp = client.get("/api/solutions?name=python", headers=refused)
+        assert resp.headers["content-type"] == "application/json"
+
+
+def test_solution_dataset_compressed(data_root):
+    solutions_dir = data_root / "solutions_json"
+    rows = json.loads((solutions_dir / "python.json").read_text()) * 20
+    (solutions_dir / "python.json").write_text(json.dumps(rows))
+    with TestClient(create_app(data_root=data_root)) as client:
+        expected = client.get("/api/solutions?name=python", headers={"Accept-Encoding": "identity"})
+        expected = expected.json()
+        assert len(expected) == 20
+        gzip_only = {"Accept-Encoding": "gzip"}
+        resp = client.get("/api/solutions?name=python", headers=gzip_only)
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.json() == expected  # precompressed body is not encoded twice
+        ndjson = {**gzip_only, "Accept": "application/x-ndjson"}
+        resp = client.get("/api/solutions?name=python", headers=ndjson)
+        assert resp.headers["content-encoding"] == "gzip"
+        assert [json.loads(line) for line in resp.text.splitlines()] == expected
+
+
+def test_solution_dataset_matches_response_model(data_root):
+    path = data_root / "solutions_json" / "python.json"
+    rows = json.loads(path.read_text())
+    rows[0]["extra_field"] = "x"
+    del rows[0]["solution"]["secure_code_example"]
+    path.write_text(json.dumps(rows))
+    with TestClient(create_app(data_root=data_root)) as client:
+        row = client.get("/api/solutions?name=python").json()[0]
+        assert "extra_field" not in row
+        assert row["last_update_time"] is None
+        assert row["solution"]["secure_code_example"] == {"description": None, "text": None}
+
+
+def test_solution_dataset_revalidated_after_file_change(data_root):
+    path = data_root / "solutions_json" / "python.json"
+    good = json.loads(path.read_text())
+    path.write_text(json.dumps([{"vulnerability_id": "VULN-1"}]))
+    with TestClient(create_app(data_root=data_root)) as client:
+        resp = client.get("/api/solutions?name=python")
+        assert resp.status_code == 500
+        assert resp.json()["detail"]["file"] == "python.json"
+        path.write_text(json.dumps(good))
+        resp = client.get("/api/solutions?name=python")
+        assert resp.status_code == 200
+        assert resp.json()[0]["vulnerability_id"] == "VULN-1"